@@ -9,9 +9,12 @@ setup(
     py_modules=["leboncoin_scraper"],
     install_requires=[
         "lbc>=1.0.9",
-        "pandas>=2.0.0",
+        "numpy>=1.24.0",
         "python-dateutil>=2.8.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0", "pyarrow>=12.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "lbc-scrape=leboncoin_scraper:main",